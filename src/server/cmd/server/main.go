@@ -19,34 +19,14 @@ type Application struct {
 	db           *database.DB
 }
 
-func (app *Application) handleOrder(w http.ResponseWriter, r *http.Request) {
-	if r.Method != http.MethodPost {
-		http.Error(w, "Method not allowed", http.StatusMethodNotAllowed)
-		return
-	}
-
-	body, err := io.ReadAll(r.Body)
-	if err != nil {
-		http.Error(w, "Failed to read request body", http.StatusInternalServerError)
-		return
-	}
-
-	var orderReq orderprotos.OrderRequest
-	if err := proto.Unmarshal(body, &orderReq); err != nil {
-		http.Error(w, "Bad request: Failed to unmarshal protobuf", http.StatusBadRequest)
-		return
-	}
-
-	// Extract user ID from request header (for now, use a default or header value)
-	userID := r.Header.Get("X-User-ID")
-	if userID == "" {
-		userID = "default_user" // Default for testing
-	}
-
+// placeOrder submits a single order to Alpaca, logs the trade to the
+// database, and builds the protobuf response. Shared by the single-order
+// and batch handlers.
+func (app *Application) placeOrder(userID string, orderReq *orderprotos.OrderRequest) *orderprotos.OrderResponse {
 	log.Printf("Received order request: User=%s Symbol=%s Qty=%s Side=%s Type=%s",
 		userID, orderReq.GetSymbol(), orderReq.GetQty(), orderReq.GetSide(), orderReq.GetOrderType())
 
-	placedOrder, err := app.alpacaClient.PlaceOrder(&orderReq)
+	placedOrder, err := app.alpacaClient.PlaceOrder(orderReq)
 	if err != nil {
 		log.Printf("Failed to place order: %v", err)
 
@@ -76,19 +56,13 @@ func (app *Application) handleOrder(w http.ResponseWriter, r *http.Request) {
 		}
 
 		// Create error response
-		errorResp := &orderprotos.OrderResponse{
+		return &orderprotos.OrderResponse{
 			Status:  "error",
 			Message: err.Error(),
 			Symbol:  orderReq.GetSymbol(),
 			Qty:     orderReq.GetQty(),
 			Side:    orderReq.GetSide(),
 		}
-
-		respBytes, _ := proto.Marshal(errorResp)
-		w.Header().Set("Content-Type", "application/x-protobuf")
-		w.WriteHeader(http.StatusInternalServerError)
-		w.Write(respBytes)
-		return
 	}
 
 	log.Printf("Successfully placed order - ID: %s, Status: %s", placedOrder.ID, placedOrder.Status)
@@ -120,7 +94,7 @@ func (app *Application) handleOrder(w http.ResponseWriter, r *http.Request) {
 	}
 
 	// Create success response
-	successResp := &orderprotos.OrderResponse{
+	return &orderprotos.OrderResponse{
 		Status:      "success",
 		OrderId:     placedOrder.ID,
 		Message:     "Order placed successfully",
@@ -130,15 +104,88 @@ func (app *Application) handleOrder(w http.ResponseWriter, r *http.Request) {
 		FilledQty:   placedOrder.FilledQty.String(),
 		OrderStatus: string(placedOrder.Status),
 	}
+}
+
+// userIDFromRequest extracts the user ID from the request header
+// (for now, use a default or header value)
+func userIDFromRequest(r *http.Request) string {
+	userID := r.Header.Get("X-User-ID")
+	if userID == "" {
+		userID = "default_user" // Default for testing
+	}
+	return userID
+}
+
+func (app *Application) handleOrder(w http.ResponseWriter, r *http.Request) {
+	if r.Method != http.MethodPost {
+		http.Error(w, "Method not allowed", http.StatusMethodNotAllowed)
+		return
+	}
+
+	body, err := io.ReadAll(r.Body)
+	if err != nil {
+		http.Error(w, "Failed to read request body", http.StatusInternalServerError)
+		return
+	}
+
+	var orderReq orderprotos.OrderRequest
+	if err := proto.Unmarshal(body, &orderReq); err != nil {
+		http.Error(w, "Bad request: Failed to unmarshal protobuf", http.StatusBadRequest)
+		return
+	}
+
+	resp := app.placeOrder(userIDFromRequest(r), &orderReq)
+
+	respBytes, err := proto.Marshal(resp)
+	if err != nil {
+		http.Error(w, "Failed to marshal response", http.StatusInternalServerError)
+		return
+	}
+
+	w.Header().Set("Content-Type", "application/x-protobuf")
+	if resp.GetStatus() == "success" {
+		w.WriteHeader(http.StatusCreated)
+	} else {
+		w.WriteHeader(http.StatusInternalServerError)
+	}
+	w.Write(respBytes)
+}
+
+func (app *Application) handleOrderBatch(w http.ResponseWriter, r *http.Request) {
+	if r.Method != http.MethodPost {
+		http.Error(w, "Method not allowed", http.StatusMethodNotAllowed)
+		return
+	}
+
+	body, err := io.ReadAll(r.Body)
+	if err != nil {
+		http.Error(w, "Failed to read request body", http.StatusInternalServerError)
+		return
+	}
+
+	var batchReq orderprotos.OrderBatchRequest
+	if err := proto.Unmarshal(body, &batchReq); err != nil {
+		http.Error(w, "Bad request: Failed to unmarshal protobuf", http.StatusBadRequest)
+		return
+	}
+
+	userID := userIDFromRequest(r)
+
+	// Place orders in request order; per-order failures are reported in
+	// the matching response rather than failing the whole batch
+	batchResp := &orderprotos.OrderBatchResponse{}
+	for _, orderReq := range batchReq.GetOrders() {
+		batchResp.Responses = append(batchResp.Responses, app.placeOrder(userID, orderReq))
+	}
 
-	respBytes, err := proto.Marshal(successResp)
+	respBytes, err := proto.Marshal(batchResp)
 	if err != nil {
 		http.Error(w, "Failed to marshal response", http.StatusInternalServerError)
 		return
 	}
 
 	w.Header().Set("Content-Type", "application/x-protobuf")
-	w.WriteHeader(http.StatusCreated)
+	w.WriteHeader(http.StatusOK)
 	w.Write(respBytes)
 }
 
@@ -181,8 +228,9 @@ func main() {
 		db:           db,
 	}
 
-	// Register the handler method
+	// Register the handler methods
 	http.HandleFunc("/order", app.handleOrder)
+	http.HandleFunc("/order/batch", app.handleOrderBatch)
 
 	port := os.Getenv("PORT")
 	if port == "" {
@@ -194,6 +242,7 @@ func main() {
 	log.Printf("Database: %s", dbPath)
 	log.Printf("Endpoints:")
 	log.Printf("   POST /order - Place a trading order (protobuf)")
+	log.Printf("   POST /order/batch - Place a batch of trading orders (protobuf)")
 
 	if err := http.ListenAndServe(":"+port, nil); err != nil {
 		log.Fatalf("Could not start server: %s", err)
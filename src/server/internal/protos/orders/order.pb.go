@@ -215,6 +215,97 @@ func (x *OrderResponse) GetOrderStatus() string {
 	return ""
 }
 
+// OrderBatchRequest carries several orders in a single request so a
+// strategy can flush all orders produced on one tick in one round-trip
+type OrderBatchRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Orders        []*OrderRequest        `protobuf:"bytes,1,rep,name=orders,proto3" json:"orders,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *OrderBatchRequest) Reset() {
+	*x = OrderBatchRequest{}
+	mi := &file_order_proto_msgTypes[2]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *OrderBatchRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*OrderBatchRequest) ProtoMessage() {}
+
+func (x *OrderBatchRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_order_proto_msgTypes[2]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use OrderBatchRequest.ProtoReflect.Descriptor instead.
+func (*OrderBatchRequest) Descriptor() ([]byte, []int) {
+	return file_order_proto_rawDescGZIP(), []int{2}
+}
+
+func (x *OrderBatchRequest) GetOrders() []*OrderRequest {
+	if x != nil {
+		return x.Orders
+	}
+	return nil
+}
+
+// OrderBatchResponse returns one response per order, in request order
+type OrderBatchResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Responses     []*OrderResponse       `protobuf:"bytes,1,rep,name=responses,proto3" json:"responses,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *OrderBatchResponse) Reset() {
+	*x = OrderBatchResponse{}
+	mi := &file_order_proto_msgTypes[3]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *OrderBatchResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*OrderBatchResponse) ProtoMessage() {}
+
+func (x *OrderBatchResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_order_proto_msgTypes[3]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use OrderBatchResponse.ProtoReflect.Descriptor instead.
+func (*OrderBatchResponse) Descriptor() ([]byte, []int) {
+	return file_order_proto_rawDescGZIP(), []int{3}
+}
+
+func (x *OrderBatchResponse) GetResponses() []*OrderResponse {
+	if x != nil {
+		return x.Responses
+	}
+	return nil
+}
+
 var File_order_proto protoreflect.FileDescriptor
 
 const file_order_proto_rawDesc = "" +
@@ -240,7 +331,11 @@ const file_order_proto_rawDesc = "" +
 	"\x04side\x18\x06 \x01(\tR\x04side\x12\x1d\n" +
 	"\n" +
 	"filled_qty\x18\a \x01(\tR\tfilledQty\x12!\n" +
-	"\forder_status\x18\b \x01(\tR\vorderStatusB%Z#trading-desk/internal/protos/ordersb\x06proto3"
+	"\forder_status\x18\b \x01(\tR\vorderStatus\"A\n" +
+	"\x11OrderBatchRequest\x12,\n" +
+	"\x06orders\x18\x01 \x03(\v2\x14.orders.OrderRequestR\x06orders\"I\n" +
+	"\x12OrderBatchResponse\x123\n" +
+	"\tresponses\x18\x01 \x03(\v2\x15.orders.OrderResponseR\tresponsesB%Z#trading-desk/internal/protos/ordersb\x06proto3"
 
 var (
 	file_order_proto_rawDescOnce sync.Once
@@ -254,17 +349,21 @@ func file_order_proto_rawDescGZIP() []byte {
 	return file_order_proto_rawDescData
 }
 
-var file_order_proto_msgTypes = make([]protoimpl.MessageInfo, 2)
+var file_order_proto_msgTypes = make([]protoimpl.MessageInfo, 4)
 var file_order_proto_goTypes = []any{
-	(*OrderRequest)(nil),  // 0: orders.OrderRequest
-	(*OrderResponse)(nil), // 1: orders.OrderResponse
+	(*OrderRequest)(nil),       // 0: orders.OrderRequest
+	(*OrderResponse)(nil),      // 1: orders.OrderResponse
+	(*OrderBatchRequest)(nil),  // 2: orders.OrderBatchRequest
+	(*OrderBatchResponse)(nil), // 3: orders.OrderBatchResponse
 }
 var file_order_proto_depIdxs = []int32{
-	0, // [0:0] is the sub-list for method output_type
-	0, // [0:0] is the sub-list for method input_type
-	0, // [0:0] is the sub-list for extension type_name
-	0, // [0:0] is the sub-list for extension extendee
-	0, // [0:0] is the sub-list for field type_name
+	0, // 0: orders.OrderBatchRequest.orders:type_name -> orders.OrderRequest
+	1, // 1: orders.OrderBatchResponse.responses:type_name -> orders.OrderResponse
+	2, // [2:2] is the sub-list for method output_type
+	2, // [2:2] is the sub-list for method input_type
+	2, // [2:2] is the sub-list for extension type_name
+	2, // [2:2] is the sub-list for extension extendee
+	0, // [0:2] is the sub-list for field type_name
 }
 
 func init() { file_order_proto_init() }
@@ -278,7 +377,7 @@ func file_order_proto_init() {
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_order_proto_rawDesc), len(file_order_proto_rawDesc)),
 			NumEnums:      0,
-			NumMessages:   2,
+			NumMessages:   4,
 			NumExtensions: 0,
 			NumServices:   0,
 		},
@@ -2,6 +2,48 @@
 Desk Client Library - Helper library for Quant Club Trading Desk strategies
 """
 
-from .client import place_order, get_server_url, set_user_id
+from google.protobuf.internal import api_implementation
 
-__all__ = ['place_order', 'get_server_url', 'set_user_id']
+# The pure-Python protobuf backend is 6-72x slower than the C++/upb one,
+# which matters on the per-order serialize/parse path. Fail loudly at
+# import rather than running every strategy in slow motion.
+if api_implementation.Type() not in ("cpp", "upb"):
+    raise ImportError(
+        "desk_client requires the C++/upb protobuf implementation, but the "
+        f"pure-Python backend is active ({api_implementation.Type()!r}). "
+        'Reinstall the runtime with: pip install "protobuf>=5.29.2" '
+        "and make sure PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION is not set "
+        'to "python".'
+    )
+
+from .client import (
+    place_order,
+    place_order_async,
+    place_orders,
+    build_order,
+    prebuild_order,
+    place_order_prebuilt,
+    place_order_prebuilt_async,
+    place_order_status_only,
+    get_server_url,
+    set_user_id,
+    close,
+    aclose,
+)
+from .runtime import tune_scheduling
+
+__all__ = [
+    'place_order',
+    'place_order_async',
+    'place_orders',
+    'build_order',
+    'prebuild_order',
+    'place_order_prebuilt',
+    'place_order_prebuilt_async',
+    'place_order_status_only',
+    'get_server_url',
+    'set_user_id',
+    'close',
+    'aclose',
+    'tune_scheduling',
+]
@@ -3,22 +3,132 @@ Client library for communicating with the Trading Desk server.
 Handles protobuf serialization and HTTP requests.
 """
 
+import atexit
+import logging
 import os
-import requests
+import queue
+import sys
+import threading
+import httpx
+import urllib3
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
-from .order_pb2 import OrderRequest, OrderResponse
+from .order_pb2 import (
+    OrderRequest,
+    OrderResponse,
+    OrderBatchRequest,
+    OrderBatchResponse,
+)
 
 
 # Global configuration
 _server_url = os.getenv("DESK_SERVER_URL", "http://localhost:8080")
-_user_id = os.getenv("USER_ID", "default_user")
+_user_id = sys.intern(os.getenv("USER_ID", "default_user"))
+
+# Precomputed per-order constants: the endpoint URL and the per-call
+# header dict are built once here instead of being re-formatted and
+# re-allocated on every order. set_user_id keeps them in sync.
+_order_url = f"{_server_url}/order"
+_batch_url = f"{_server_url}/order/batch"
+_headers = {
+    "Content-Type": "application/x-protobuf",
+    "X-User-ID": _user_id
+}
+
+# Headers for the status-only path: identity encoding means the bounded
+# read below sees raw protobuf bytes with no decompression step.
+_status_headers = {
+    "Content-Type": "application/x-protobuf",
+    "Accept-Encoding": "identity",
+    "X-User-ID": _user_id
+}
+
+# Upper bound on how much of a status-only response is read. Order
+# responses are far smaller than this in practice, so the whole body
+# still parses; a body longer than this fails to parse.
+_STATUS_READ_LIMIT = 4096
+
+# Order logging goes through a queue drained by a background thread, so
+# the hot path only enqueues; it never blocks on the (unbuffered, under
+# docker run -u) stdout pipe write.
+_log_queue = queue.SimpleQueue()
+logger = logging.getLogger("desk_client")
+logger.setLevel(logging.INFO)
+logger.addHandler(QueueHandler(_log_queue))
+logger.propagate = False
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Pooled urllib3 client so the TCP/TLS connection stays warm across
+# orders. Talking to urllib3 directly skips the per-call
+# prepare/send/hook machinery the requests wrapper layers on top of it.
+_http = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=32,
+    retries=urllib3.Retry(
+        total=2,
+        backoff_factor=0.05,
+        status_forcelist=[502, 503, 504]
+    )
+)
+
+# Intern the small closed vocabulary of order fields so each assignment
+# hashes a pre-cached string instead of re-hashing per call.
+for _word in ("buy", "sell", "market", "limit", "stop", "stop_limit",
+              "day", "gtc", "ioc", "fok"):
+    sys.intern(_word)
+del _word
+
+# Reusable protobuf messages for the synchronous hot path. Creating a
+# fresh message per order walks every field descriptor in Python;
+# Clear() on a pooled instance does not. Thread-local so concurrent
+# callers never share a message. (The async path builds fresh messages:
+# tasks on one event loop share a thread, so pooling would corrupt
+# overlapping orders.)
+_msg_pool = threading.local()
+
+
+def _pooled_request() -> OrderRequest:
+    req = getattr(_msg_pool, "req", None)
+    if req is None:
+        req = _msg_pool.req = OrderRequest()
+    req.Clear()
+    return req
+
+
+def _pooled_response() -> OrderResponse:
+    resp = getattr(_msg_pool, "resp", None)
+    if resp is None:
+        resp = _msg_pool.resp = OrderResponse()
+    resp.Clear()
+    return resp
+
+
+# Async HTTP client, created lazily so synchronous strategies never pay
+# for it. HTTP/2 multiplexing lets many in-flight orders share one
+# connection instead of serializing round-trips.
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            headers={"Content-Type": "application/x-protobuf"}
+        )
+    return _async_client
 
 
 def set_user_id(user_id: str) -> None:
     """Set the user ID for all subsequent requests."""
     global _user_id
-    _user_id = user_id
+    _user_id = sys.intern(user_id)
+    _headers["X-User-ID"] = _user_id
+    _status_headers["X-User-ID"] = _user_id
 
 
 def get_server_url() -> str:
@@ -26,6 +136,11 @@ def get_server_url() -> str:
     return _server_url
 
 
+def close() -> None:
+    """Close the pooled HTTP connections."""
+    _http.clear()
+
+
 def place_order(
     symbol: str,
     qty: str,
@@ -53,47 +168,259 @@ def place_order(
         OrderResponse: Protobuf response from the server
 
     Raises:
-        requests.exceptions.RequestException: If the request fails
+        urllib3.exceptions.HTTPError: If the request fails
         ValueError: If the response cannot be parsed
     """
-    # Create protobuf request
-    order_req = OrderRequest(
-        symbol=symbol,
-        qty=qty,
-        side=side,
-        order_type=order_type,
-        time_in_force=time_in_force
-    )
+    # Populate the pooled protobuf request
+    order_req = _pooled_request()
+    order_req.symbol = symbol
+    order_req.qty = qty
+    order_req.side = side
+    order_req.order_type = order_type
+    order_req.time_in_force = time_in_force
 
-    if limit_price:
+    # Compare against None so a literal "0" price is still sent
+    if limit_price is not None:
         order_req.limit_price = limit_price
-    if stop_price:
+    if stop_price is not None:
         order_req.stop_price = stop_price
 
-    # Serialize to protobuf
-    request_data = order_req.SerializeToString()
+    # Serialize to protobuf and send
+    return place_order_prebuilt(order_req.SerializeToString(), timeout=timeout)
+
+
+def prebuild_order(**fields) -> bytes:
+    """
+    Serialize an OrderRequest once for repeated use.
+
+    A strategy that sends the same order on every signal can build its
+    bytes at startup and pass them to place_order_prebuilt, skipping
+    message construction and serialization on the hot path entirely.
+
+    Args:
+        **fields: OrderRequest fields (symbol, qty, side, order_type,
+            time_in_force, limit_price, stop_price)
+
+    Returns:
+        bytes: The serialized OrderRequest
+    """
+    return OrderRequest(**fields).SerializeToString()
+
+
+def place_order_prebuilt(body: bytes, timeout: int = 10) -> OrderResponse:
+    """
+    POST an already-serialized OrderRequest to the Desk server.
+
+    Args:
+        body: Serialized OrderRequest bytes, e.g. from prebuild_order
+        timeout: Request timeout in seconds
+
+    Returns:
+        OrderResponse: Protobuf response from the server
+
+    Raises:
+        urllib3.exceptions.HTTPError: If the request fails
+        ValueError: If the response cannot be parsed
+    """
+    response = _http.request(
+        "POST",
+        _order_url,
+        body=body,
+        headers=_headers,
+        timeout=timeout
+    )
+
+    # Parse into the pooled protobuf response
+    order_resp = _pooled_response()
+    order_resp.MergeFromString(response.data)
+
+    # Log the response (enqueued; the listener thread writes it out)
+    if order_resp.status == "success":
+        logger.info(f"✓ Order placed: {order_resp.order_id} - {order_resp.symbol} {order_resp.qty} {order_resp.side}")
+    else:
+        logger.info(f"✗ Order failed: {order_resp.message}")
+
+    return order_resp
+
+
+def place_orders(orders, timeout: int = 10) -> list:
+    """
+    Place several orders in one round-trip to the Desk server.
+
+    Orders produced on the same tick share one POST to /order/batch
+    instead of paying HTTP framing and a round-trip each.
+
+    Args:
+        orders: Iterable of OrderRequest messages (see build_order)
+        timeout: Request timeout in seconds
 
-    # Make HTTP POST request
-    headers = {
-        "Content-Type": "application/x-protobuf",
-        "X-User-ID": _user_id
+    Returns:
+        list[OrderResponse]: One response per order, in request order
+
+    Raises:
+        urllib3.exceptions.HTTPError: If the request fails
+        ValueError: If the response cannot be parsed
+    """
+    batch = OrderBatchRequest()
+    batch.orders.extend(orders)
+
+    response = _http.request(
+        "POST",
+        _batch_url,
+        body=batch.SerializeToString(),
+        headers=_headers,
+        timeout=timeout
+    )
+
+    batch_resp = OrderBatchResponse()
+    batch_resp.MergeFromString(response.data)
+    return list(batch_resp.responses)
+
+
+def build_order(**fields) -> OrderRequest:
+    """
+    Build an OrderRequest message, e.g. for collecting into place_orders.
+
+    Args:
+        **fields: OrderRequest fields (symbol, qty, side, order_type,
+            time_in_force, limit_price, stop_price)
+
+    Returns:
+        OrderRequest: The populated message
+    """
+    return OrderRequest(**fields)
+
+
+def place_order_status_only(body: bytes, timeout: int = 10) -> OrderResponse:
+    """
+    POST a serialized order and parse only the leading response fields.
+
+    For fire-and-log callers that just check status/order_id, this skips
+    preloading the body: it reads a bounded prefix off the socket and
+    parses that. Order responses fit well inside the bound in practice;
+    a response larger than the bound is truncated and fails to parse
+    (MergeFromString raises). No success/failure line is printed.
+
+    Args:
+        body: Serialized OrderRequest bytes, e.g. from prebuild_order
+        timeout: Request timeout in seconds
+
+    Returns:
+        OrderResponse: Response with at least status and order_id set
+
+    Raises:
+        urllib3.exceptions.HTTPError: If the request fails
+        ValueError: If the response cannot be parsed
+    """
+    response = _http.request(
+        "POST",
+        _order_url,
+        body=body,
+        headers=_status_headers,
+        timeout=timeout,
+        preload_content=False
+    )
+    data = response.read(_STATUS_READ_LIMIT)
+    # Drain any bytes past the limit so the connection goes back to the
+    # pool clean; releasing it with unread body bytes would desync the
+    # next request on that connection.
+    response.drain_conn()
+
+    order_resp = _pooled_response()
+    order_resp.MergeFromString(data)
+    return order_resp
+
+
+async def place_order_async(
+    symbol: str,
+    qty: str,
+    side: str,
+    order_type: str = "market",
+    time_in_force: str = "day",
+    limit_price: Optional[str] = None,
+    stop_price: Optional[str] = None,
+    timeout: int = 10
+) -> OrderResponse:
+    """
+    Place a trading order asynchronously.
+
+    Same semantics as place_order, but awaitable, so an async strategy can
+    keep multiple orders in flight on one HTTP/2 connection instead of
+    blocking on each round-trip.
+
+    Args:
+        symbol: Stock symbol (e.g., "AAPL")
+        qty: Quantity as string (e.g., "10" or "10.5")
+        side: "buy" or "sell"
+        order_type: "market", "limit", "stop", or "stop_limit"
+        time_in_force: "day", "gtc", "ioc", or "fok"
+        limit_price: Optional limit price for limit orders
+        stop_price: Optional stop price for stop orders
+        timeout: Request timeout in seconds
+
+    Returns:
+        OrderResponse: Protobuf response from the server
+
+    Raises:
+        httpx.HTTPError: If the request fails
+        ValueError: If the response cannot be parsed
+    """
+    kwargs = {
+        "symbol": symbol,
+        "qty": qty,
+        "side": side,
+        "order_type": order_type,
+        "time_in_force": time_in_force
     }
 
-    response = requests.post(
-        f"{_server_url}/order",
-        data=request_data,
-        headers=headers,
+    # Compare against None so a literal "0" price is still sent
+    if limit_price is not None:
+        kwargs["limit_price"] = limit_price
+    if stop_price is not None:
+        kwargs["stop_price"] = stop_price
+
+    # One constructor call sets every field in a single descriptor walk
+    request_data = OrderRequest(**kwargs).SerializeToString()
+    return await place_order_prebuilt_async(request_data, timeout=timeout)
+
+
+async def place_order_prebuilt_async(body: bytes, timeout: int = 10) -> OrderResponse:
+    """
+    Awaitable variant of place_order_prebuilt.
+
+    Args:
+        body: Serialized OrderRequest bytes, e.g. from prebuild_order
+        timeout: Request timeout in seconds
+
+    Returns:
+        OrderResponse: Protobuf response from the server
+
+    Raises:
+        httpx.HTTPError: If the request fails
+        ValueError: If the response cannot be parsed
+    """
+    client = _get_async_client()
+    response = await client.post(
+        _order_url,
+        content=body,
+        headers=_headers,
         timeout=timeout
     )
 
-    # Parse protobuf response
     order_resp = OrderResponse()
     order_resp.ParseFromString(response.content)
 
-    # Log the response
     if order_resp.status == "success":
-        print(f"✓ Order placed: {order_resp.order_id} - {order_resp.symbol} {order_resp.qty} {order_resp.side}")
+        logger.info(f"✓ Order placed: {order_resp.order_id} - {order_resp.symbol} {order_resp.qty} {order_resp.side}")
     else:
-        print(f"✗ Order failed: {order_resp.message}")
+        logger.info(f"✗ Order failed: {order_resp.message}")
 
     return order_resp
+
+
+async def aclose() -> None:
+    """Close the shared async HTTP client."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0border.proto\x12\x06orders\"\x8d\x01\n\x0cOrderRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x0b\n\x03qty\x18\x02 \x01(\t\x12\x0c\n\x04side\x18\x03 \x01(\t\x12\x12\n\norder_type\x18\x04 \x01(\t\x12\x15\n\rtime_in_force\x18\x05 \x01(\t\x12\x13\n\x0blimit_price\x18\x06 \x01(\t\x12\x12\n\nstop_price\x18\x07 \x01(\t\"\x97\x01\n\rOrderResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x10\n\x08order_id\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x0e\n\x06symbol\x18\x04 \x01(\t\x12\x0b\n\x03qty\x18\x05 \x01(\t\x12\x0c\n\x04side\x18\x06 \x01(\t\x12\x12\n\nfilled_qty\x18\x07 \x01(\t\x12\x14\n\x0corder_status\x18\x08 \x01(\tB%Z#trading-desk/internal/protos/ordersb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0border.proto\x12\x06orders\"\x8d\x01\n\x0cOrderRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x0b\n\x03qty\x18\x02 \x01(\t\x12\x0c\n\x04side\x18\x03 \x01(\t\x12\x12\n\norder_type\x18\x04 \x01(\t\x12\x15\n\rtime_in_force\x18\x05 \x01(\t\x12\x13\n\x0blimit_price\x18\x06 \x01(\t\x12\x12\n\nstop_price\x18\x07 \x01(\t\"\x97\x01\n\rOrderResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x10\n\x08order_id\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x0e\n\x06symbol\x18\x04 \x01(\t\x12\x0b\n\x03qty\x18\x05 \x01(\t\x12\x0c\n\x04side\x18\x06 \x01(\t\x12\x12\n\nfilled_qty\x18\x07 \x01(\t\x12\x14\n\x0corder_status\x18\x08 \x01(\t\"9\n\x11OrderBatchRequest\x12$\n\x06orders\x18\x01 \x03(\x0b\x32\x14.orders.OrderRequest\">\n\x12OrderBatchResponse\x12(\n\tresponses\x18\x01 \x03(\x0b\x32\x15.orders.OrderResponseB%Z#trading-desk/internal/protos/ordersb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -36,4 +36,8 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_ORDERREQUEST']._serialized_end=165
   _globals['_ORDERRESPONSE']._serialized_start=168
   _globals['_ORDERRESPONSE']._serialized_end=319
+  _globals['_ORDERBATCHREQUEST']._serialized_start=321
+  _globals['_ORDERBATCHREQUEST']._serialized_end=378
+  _globals['_ORDERBATCHRESPONSE']._serialized_start=380
+  _globals['_ORDERBATCHRESPONSE']._serialized_end=442
 # @@protoc_insertion_point(module_scope)
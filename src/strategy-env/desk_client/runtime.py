@@ -0,0 +1,41 @@
+"""
+Runtime tuning helpers for strategy processes.
+Keeps scheduler-induced jitter out of the order hot path.
+"""
+
+import os
+import sys
+from typing import Optional
+
+
+def tune_scheduling(cpu: Optional[int] = None, niceness: int = -10) -> None:
+    """
+    Pin this process to one CPU and raise its scheduling priority.
+
+    Pinning keeps the strategy's caches warm on a single core and the
+    priority bump trims scheduler-induced tail latency. Call it at the
+    top of a strategy's main().
+
+    Args:
+        cpu: CPU index to pin to; defaults to the CPU_AFFINITY
+            environment variable (set from config.json by the manager)
+        niceness: Nice increment to apply; negative values need
+            CAP_SYS_NICE, which the manager grants to containers
+
+    Both steps are best-effort: a strategy still runs, just with more
+    jitter, if the container lacks the needed privileges.
+    """
+    if cpu is None:
+        env_cpu = os.getenv("CPU_AFFINITY")
+        cpu = int(env_cpu) if env_cpu else None
+
+    if cpu is not None:
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except (AttributeError, OSError) as e:
+            print(f"Warning: could not pin to CPU {cpu}: {e}", file=sys.stderr)
+
+    try:
+        os.nice(niceness)
+    except OSError as e:
+        print(f"Warning: could not raise scheduling priority: {e}", file=sys.stderr)
@@ -1,13 +1,30 @@
 from setuptools import setup, find_packages
 
+# Compile the order hot path with Cython when it is available. client.py
+# stays valid pure Python, so environments without Cython (or a C
+# compiler) fall back to the interpreted module with no API change.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        "desk_client/client.py",
+        language_level=3,
+        compiler_directives={"boundscheck": False, "wraparound": False},
+    )
+except ImportError:
+    ext_modules = []
+
 setup(
     name="desk-client",
     version="0.1.0",
     description="Client library for Quant Club Trading Desk",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
+        # Ships the upb C extension; desk_client refuses to import on the
+        # pure-Python backend (PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python)
         "protobuf>=5.29.2",
-        "requests>=2.32.3",
+        "urllib3>=2.3.0",
+        "httpx[http2]>=0.28.1",
     ],
     python_requires=">=3.8",
 )
@@ -3,17 +3,64 @@
 Example strategy for Alice - Momentum Trading
 """
 
-import json
+import asyncio
 import sys
-from desk_client import place_order
+from desk_client import prebuild_order, place_order_prebuilt_async, aclose, tune_scheduling
 
+# orjson parses in C and accepts bytes directly; fall back to stdlib json
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
-def main():
+# Alice always sends the same order, so serialize it once at startup and
+# reuse the bytes on every signal
+_BUY_5_AAPL = prebuild_order(
+    symbol="AAPL",
+    qty="5",
+    side="buy",
+    order_type="market",
+    time_in_force="day"
+)
+
+
+async def connect_stdin(loop) -> asyncio.StreamReader:
+    """Wrap stdin in an asyncio StreamReader so reads don't block the loop."""
+    reader = asyncio.StreamReader()
+    protocol = asyncio.StreamReaderProtocol(reader)
+    await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+    return reader
+
+
+async def handle_order() -> None:
+    """Place the prebuilt buy order and log the result."""
+    try:
+        response = await place_order_prebuilt_async(_BUY_5_AAPL)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return
+
+    if response.status == "success":
+        print(f"✓ Order placed: {response.order_id}")
+    else:
+        print(f"✗ Order failed: {response.message}")
+
+
+async def main():
+    tune_scheduling()
     print("Alice's momentum strategy started")
 
-    for line in sys.stdin:
+    loop = asyncio.get_running_loop()
+    reader = await connect_stdin(loop)
+    pending = set()
+
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+
         try:
-            market_data = json.loads(line.strip())
+            market_data = _json.loads(line)
             symbol = market_data.get("symbol")
             price = market_data.get("price")
 
@@ -22,27 +69,23 @@ def main():
 
             print(f"Received: {symbol} @ ${price}")
 
-            # Simple momentum logic
+            # Simple momentum logic - fire the order as a task so the loop
+            # keeps consuming market data while the order is in flight
             if symbol == "AAPL" and price < 145.0:
                 print(f"Price ${price} looks good, placing buy order...")
-                response = place_order(
-                    symbol="AAPL",
-                    qty="5",
-                    side="buy",
-                    order_type="market",
-                    time_in_force="day"
-                )
-
-                if response.status == "success":
-                    print(f"✓ Order placed: {response.order_id}")
-                else:
-                    print(f"✗ Order failed: {response.message}")
-
-        except json.JSONDecodeError as e:
+                task = asyncio.create_task(handle_order())
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+        except ValueError as e:
             print(f"Failed to parse JSON: {e}", file=sys.stderr)
         except Exception as e:
             print(f"Error: {e}", file=sys.stderr)
 
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    await aclose()
+
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
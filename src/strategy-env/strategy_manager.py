@@ -9,11 +9,16 @@ logging, error handling, and integration with the database.
 import argparse
 import json
 import os
-import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Optional
 
+import docker
+from docker.errors import APIError, NotFound
+from docker.types import Ulimit
+
 
 class StrategyManager:
     def __init__(
@@ -27,45 +32,85 @@ class StrategyManager:
         self.server_url = server_url
         self.docker_image = docker_image
         self.network_name = network_name
-
-    def _run_command(self, cmd: List[str], capture_output=True) -> subprocess.CompletedProcess:
-        """Run a shell command and return the result."""
-        return subprocess.run(
-            cmd,
-            capture_output=capture_output,
-            text=True,
-            check=False
-        )
+        # Talk to the daemon over its socket directly; no docker CLI
+        # fork+exec and no text output to re-parse per operation
+        self.client = docker.from_env()
+        # Keeps output lines whole when process_all runs workers in parallel
+        self._print_lock = threading.Lock()
+        # config.json parse cache: path -> (mtime_ns, config)
+        self._config_cache: Dict[Path, tuple] = {}
+
+    def _log(self, message: str) -> None:
+        """Print a line atomically across worker threads."""
+        with self._print_lock:
+            print(message)
 
     def ensure_network(self) -> None:
         """Ensure Docker network exists."""
-        result = self._run_command(["docker", "network", "inspect", self.network_name])
-        if result.returncode != 0:
+        try:
+            self.client.networks.get(self.network_name)
+        except NotFound:
             print(f"Creating Docker network: {self.network_name}")
-            self._run_command(["docker", "network", "create", self.network_name])
+            self.client.networks.create(self.network_name)
 
     def get_container_name(self, strategy_dir: Path) -> str:
         """Generate container name from strategy directory name."""
         return f"strategy-{strategy_dir.name}"
 
     def get_config(self, strategy_dir: Path) -> Dict[str, any]:
-        """Get config from config.json file."""
+        """Get config from config.json file.
+
+        Parsed configs are cached per strategy and invalidated by mtime,
+        so repeated operations don't re-read and re-parse the same file.
+        """
         config_file = strategy_dir / "config.json"
-        if config_file.exists():
-            return json.loads(config_file.read_text())
-        return {}
+        try:
+            mtime = os.stat(config_file).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+
+        cached = self._config_cache.get(strategy_dir)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        config = json.loads(config_file.read_text())
+        self._config_cache[strategy_dir] = (mtime, config)
+        return config
 
     def get_user_id(self, strategy_dir: Path) -> str:
         """Get user ID for a strategy from config.json or directory name."""
         config = self.get_config(strategy_dir)
         return config.get("user_id", strategy_dir.name)
 
-    def is_running(self, container_name: str) -> bool:
-        """Check if a container is running."""
-        result = self._run_command(["docker", "ps", "--format", "{{.Names}}"])
-        return container_name in result.stdout.split("\n")
-
-    def start_strategy(self, strategy_dir: Path) -> bool:
+    def _snapshot_containers(
+        self,
+        include_stopped: bool = False,
+        sparse: bool = False
+    ) -> Dict[str, "docker.models.containers.Container"]:
+        """Map container name to container object.
+
+        With sparse=True this is a single daemon call; the returned
+        containers carry only the list-endpoint fields, which is enough
+        for name-membership checks. Without it, docker-py follows up
+        with one inspect per container to fill in attrs["State"] and
+        friends, so reserve the non-sparse form for the status path.
+        """
+        containers = self.client.containers.list(all=include_stopped, sparse=sparse)
+        snapshot = {}
+        for container in containers:
+            # Sparse containers expose "Names" (slash-prefixed) instead
+            # of the inspect endpoint's "Name"
+            name = container.attrs.get("Name") or container.attrs.get("Names", [""])[0]
+            snapshot[name.lstrip("/")] = container
+        return snapshot
+
+    def is_running(self, container_name: str, snapshot: Optional[Dict] = None) -> bool:
+        """Check if a container is running, against a snapshot if provided."""
+        if snapshot is not None:
+            return container_name in snapshot
+        return container_name in self._snapshot_containers(sparse=True)
+
+    def start_strategy(self, strategy_dir: Path, running: Optional[Dict] = None) -> bool:
         """Start a single strategy container."""
         container_name = self.get_container_name(strategy_dir)
         user_id = self.get_user_id(strategy_dir)
@@ -74,56 +119,79 @@ class StrategyManager:
 
         # Check if strategy.py exists
         if not strategy_file.exists():
-            print(f"✗ No strategy.py found in {strategy_dir}")
+            self._log(f"✗ No strategy.py found in {strategy_dir}")
             return False
 
-        if self.is_running(container_name):
-            print(f"⚠ Strategy {container_name} is already running")
+        if self.is_running(container_name, running):
+            self._log(f"⚠ Strategy {container_name} is already running")
             return False
 
-        print(f"▶ Starting strategy: {container_name} (user: {user_id})")
-
-        # Build docker run command
-        cmd = [
-            "docker", "run", "-d",
-            "--name", container_name,
-            "--network", self.network_name,
-            "--restart", "unless-stopped",
-            "-e", f"DESK_SERVER_URL={self.server_url}",
-            "-e", f"USER_ID={user_id}",
-            "-v", f"{strategy_dir.absolute()}:/app/strategy:ro",
-        ]
-
-        # Add any additional environment variables from config
-        for key, value in config.get("env", {}).items():
-            cmd.extend(["-e", f"{key}={value}"])
-
-        # Add image and command
-        cmd.extend([self.docker_image, "python", "-u", "/app/strategy/strategy.py"])
-
-        result = self._run_command(cmd)
-        if result.returncode == 0:
-            print(f"✓ Started {container_name}")
+        self._log(f"▶ Starting strategy: {container_name} (user: {user_id})")
+
+        # Base environment plus any extra variables from config
+        environment = {
+            "DESK_SERVER_URL": self.server_url,
+            "USER_ID": user_id,
+        }
+        environment.update(config.get("env", {}))
+
+        # Latency tuning: grant CAP_SYS_NICE and an rtprio ulimit so the
+        # strategy can raise its own priority, and pin it to a core when
+        # config.json sets cpu_affinity (see desk_client.tune_scheduling)
+        run_kwargs = {
+            "cap_add": ["SYS_NICE"],
+            "cpu_shares": 1024,
+            "ulimits": [Ulimit(name="rtprio", soft=99, hard=99)],
+        }
+        cpu_affinity = config.get("cpu_affinity")
+        if cpu_affinity is not None:
+            run_kwargs["cpuset_cpus"] = str(cpu_affinity)
+            environment["CPU_AFFINITY"] = str(cpu_affinity)
+
+        try:
+            self.client.containers.run(
+                self.docker_image,
+                command=["python", "-u", "/app/strategy/strategy.py"],
+                name=container_name,
+                network=self.network_name,
+                restart_policy={"Name": "unless-stopped"},
+                environment=environment,
+                volumes={
+                    str(strategy_dir.absolute()): {
+                        "bind": "/app/strategy",
+                        "mode": "ro"
+                    }
+                },
+                detach=True,
+                **run_kwargs
+            )
+            self._log(f"✓ Started {container_name}")
             return True
-        else:
-            print(f"✗ Failed to start {container_name}: {result.stderr}")
+        except APIError as e:
+            self._log(f"✗ Failed to start {container_name}: {e}")
             return False
 
-    def stop_strategy(self, strategy_dir: Path) -> bool:
+    def stop_strategy(self, strategy_dir: Path, running: Optional[Dict] = None) -> bool:
         """Stop a single strategy container."""
         container_name = self.get_container_name(strategy_dir)
 
-        if not self.is_running(container_name):
-            print(f"⚠ Strategy {container_name} is not running")
+        if not self.is_running(container_name, running):
+            self._log(f"⚠ Strategy {container_name} is not running")
             return False
 
-        print(f"■ Stopping strategy: {container_name}")
+        self._log(f"■ Stopping strategy: {container_name}")
 
         # Stop and remove container
-        self._run_command(["docker", "stop", container_name])
-        self._run_command(["docker", "rm", container_name])
+        try:
+            container = (running or {}).get(container_name) or \
+                self.client.containers.get(container_name)
+            container.stop()
+            container.remove()
+        except (NotFound, APIError) as e:
+            self._log(f"✗ Failed to stop {container_name}: {e}")
+            return False
 
-        print(f"✓ Stopped {container_name}")
+        self._log(f"✓ Stopped {container_name}")
         return True
 
     def restart_strategy(self, strategy_dir: Path) -> bool:
@@ -133,31 +201,35 @@ class StrategyManager:
         time.sleep(1)
         return self.start_strategy(strategy_dir)
 
-    def status_strategy(self, strategy_dir: Path) -> Dict[str, str]:
-        """Get status of a single strategy."""
+    def status_strategy(
+        self,
+        strategy_dir: Path,
+        containers: Optional[Dict] = None
+    ) -> Dict[str, str]:
+        """Get status of a single strategy.
+
+        The optional snapshot lets process_all gather all container state
+        with one daemon call instead of one per strategy.
+        """
         container_name = self.get_container_name(strategy_dir)
 
-        if self.is_running(container_name):
-            # Get detailed status
-            result = self._run_command([
-                "docker", "inspect", "-f",
-                "{{.State.Status}}|{{.State.Running}}|{{.State.StartedAt}}",
-                container_name
-            ])
-            status, running, started = result.stdout.strip().split("|")
+        if containers is None:
+            containers = self._snapshot_containers(include_stopped=True)
+
+        container = containers.get(container_name)
+        if container is None:
+            return {"name": container_name, "status": "not_deployed"}
+
+        state = container.attrs["State"]
+        if state["Running"]:
             return {
                 "name": container_name,
                 "status": "running",
-                "details": status,
-                "started_at": started
+                "details": state["Status"],
+                "started_at": state["StartedAt"]
             }
         else:
-            # Check if container exists but stopped
-            result = self._run_command(["docker", "ps", "-a", "--format", "{{.Names}}"])
-            if container_name in result.stdout:
-                return {"name": container_name, "status": "stopped"}
-            else:
-                return {"name": container_name, "status": "not_deployed"}
+            return {"name": container_name, "status": "stopped"}
 
     def print_status(self, status: Dict[str, str]) -> None:
         """Pretty print strategy status."""
@@ -165,22 +237,31 @@ class StrategyManager:
         state = status["status"]
 
         if state == "running":
-            print(f"● {name} - {status['details']} (started: {status['started_at'][:19]})")
+            self._log(f"● {name} - {status['details']} (started: {status['started_at'][:19]})")
         elif state == "stopped":
-            print(f"○ {name} - stopped")
+            self._log(f"○ {name} - stopped")
         else:
-            print(f"◌ {name} - not deployed")
+            self._log(f"◌ {name} - not deployed")
 
     def logs_strategy(self, strategy_dir: Path, follow: bool = False, tail: int = 100) -> None:
         """Show logs for a strategy."""
         container_name = self.get_container_name(strategy_dir)
 
-        cmd = ["docker", "logs"]
-        if follow:
-            cmd.append("-f")
-        cmd.extend(["--tail", str(tail), container_name])
+        try:
+            container = self.client.containers.get(container_name)
+        except NotFound:
+            print(f"Error: Container not found: {container_name}")
+            return
 
-        subprocess.run(cmd)
+        if follow:
+            try:
+                for chunk in container.logs(stream=True, follow=True, tail=tail):
+                    sys.stdout.buffer.write(chunk)
+                    sys.stdout.buffer.flush()
+            except KeyboardInterrupt:
+                pass
+        else:
+            sys.stdout.buffer.write(container.logs(tail=tail))
 
     def get_all_strategies(self) -> List[Path]:
         """Get all strategy directories in the strategies directory."""
@@ -207,16 +288,34 @@ class StrategyManager:
         print(f"Found {len(strategies)} strategy directory(s) in {self.strategies_dir}")
         print()
 
-        for strategy in strategies:
+        # Snapshot container state once instead of hitting the daemon
+        # for every strategy; start/stop only need names and IDs, so a
+        # sparse listing keeps it to one call
+        running = self._snapshot_containers(sparse=True)
+        all_containers = None
+        if action == "status":
+            all_containers = self._snapshot_containers(include_stopped=True)
+
+        # Each operation blocks on Docker I/O and strategies are
+        # independent, so fan out across a thread pool
+        with ThreadPoolExecutor(max_workers=min(16, len(strategies))) as executor:
             if action == "start":
-                self.start_strategy(strategy)
+                futures = [executor.submit(self.start_strategy, s, running)
+                           for s in strategies]
             elif action == "stop":
-                self.stop_strategy(strategy)
+                futures = [executor.submit(self.stop_strategy, s, running)
+                           for s in strategies]
             elif action == "restart":
-                self.restart_strategy(strategy)
+                futures = [executor.submit(self.restart_strategy, s)
+                           for s in strategies]
             elif action == "status":
-                status = self.status_strategy(strategy)
-                self.print_status(status)
+                futures = [executor.submit(self.status_strategy, s, all_containers)
+                           for s in strategies]
+
+            for future in as_completed(futures):
+                result = future.result()
+                if action == "status":
+                    self.print_status(result)
 
 
 def main():